@@ -2,12 +2,9 @@
 Simple startup script for local development
 """
 import os
-import sys
 from pathlib import Path
 
-# Add project root to Python path
 project_root = Path(__file__).parent
-sys.path.insert(0, str(project_root))
 
 if __name__ == "__main__":
     # Load environment variables from .env file if it exists
@@ -27,9 +24,21 @@ if __name__ == "__main__":
     print(f"💚 Health check at http://localhost:{port}/health")
     print(f"🔧 Using hallbayes from: {project_root / 'src' / 'hallbayes'}")
     
-    uvicorn.run(
-        "src.main:app",
-        host="0.0.0.0",
-        port=port,
-        reload=True,  # Enable auto-reload in development
-    )
+    if os.getenv("ENV", "dev") == "dev":
+        uvicorn.run(
+            "src.main:app",
+            host="0.0.0.0",
+            port=port,
+            reload=True,  # Enable auto-reload in development
+        )
+    else:
+        uvicorn.run(
+            "src.main:app",
+            host="0.0.0.0",
+            port=port,
+            workers=os.cpu_count(),
+            loop="auto",  # uvloop where installed (not on Windows)
+            http="httptools",
+            reload=False,
+            access_log=False,
+        )
@@ -0,0 +1,368 @@
+"""
+Python executor: FastAPI sub-app mounted at /executor by src/main.py
+"""
+from fastapi import FastAPI, HTTPException
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Optional, Dict, Any, Tuple
+import asyncio
+import builtins
+import multiprocessing
+import os
+import queue
+import sys
+from contextlib import redirect_stdout, redirect_stderr
+from functools import lru_cache
+from io import StringIO
+import traceback
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+app = FastAPI(
+    title="Python Executor API",
+    description="API for executing Python code securely",
+    version="1.0.0"
+)
+
+
+class CodeExecutionRequest(BaseModel):
+    # No whitespace stripping here: it would change the submitted source
+    model_config = ConfigDict(extra="forbid", frozen=True)
+
+    code: str
+    timeout: int = Field(30, gt=0, le=300)  # seconds, counted from when a worker starts the task
+    include_traceback: bool = False  # append the full traceback to error messages
+    context: Optional[Dict[str, Any]] = None
+
+
+class CodeExecutionResponse(BaseModel):
+    success: bool
+    output: Optional[str] = None
+    error: Optional[str] = None
+    return_value: Optional[Any] = None
+
+
+@app.get("/")
+async def root():
+    """Health check endpoint"""
+    return {
+        "status": "healthy",
+        "service": "Python Executor API",
+        "version": "1.0.0"
+    }
+
+
+@app.get("/health")
+async def health_check():
+    """Detailed health check"""
+    return {
+        "status": "healthy",
+        "python_version": sys.version,
+        "platform": sys.platform
+    }
+
+
+# Address-space cap per worker process, in MB (0 disables it)
+MEMORY_LIMIT_MB = int(os.getenv("EXECUTOR_MEMORY_LIMIT_MB", "2048"))
+
+
+def _init_worker() -> None:
+    """Runs once in every worker process."""
+    if resource is not None and MEMORY_LIMIT_MB > 0:
+        limit = MEMORY_LIMIT_MB * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+
+def _limit_cpu(timeout: Optional[int]) -> None:
+    """
+    Let the current task use at most `timeout` more seconds of CPU time.
+
+    RLIMIT_CPU counts the worker's whole lifetime, so the soft limit is moved
+    forward before every task; the kernel kills the worker with SIGXCPU if
+    user code goes past it, even if the parent never gets to.
+    """
+    if resource is None or not timeout:
+        return
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    soft = int(usage.ru_utime + usage.ru_stime + timeout) + 1
+    _, hard = resource.getrlimit(resource.RLIMIT_CPU)
+    if hard != resource.RLIM_INFINITY:
+        soft = min(soft, hard)
+    resource.setrlimit(resource.RLIMIT_CPU, (soft, hard))
+
+
+def _worker_main(conn) -> None:
+    """Worker process entry point: run tasks received on `conn` until it closes."""
+    _init_worker()
+    conn.send(os.getpid())  # ready
+    while True:
+        try:
+            fn, args = conn.recv()
+        except EOFError:
+            return
+        result = fn(*args)
+        try:
+            conn.send((True, result))
+        except Exception as e:
+            # e.g. a return value that cannot be pickled back to the parent
+            conn.send((False, str(e)))
+
+
+class WorkerCrashed(RuntimeError):
+    """The worker process died while running the task."""
+
+
+class _Worker:
+    """
+    One worker process and the pipe used to hand it tasks.
+
+    Each worker has its own process, so a worker that times out or dies only
+    takes its own task down with it. Workers are spawned, never forked: a
+    forked worker would inherit the host app's memory, including other
+    callers' API keys, and user code could read it back.
+    """
+
+    def __init__(self, ctx) -> None:
+        self.conn, child_conn = ctx.Pipe()
+        self.process = ctx.Process(target=_worker_main, args=(child_conn,), daemon=True)
+        self.process.start()
+        child_conn.close()
+        self.pid: Optional[int] = None
+
+    def call(self, fn, args: tuple, timeout: float) -> Any:
+        """Run one task and return its result. Blocks, so call it from a thread."""
+        if self.pid is None:
+            # Wait for the worker to finish starting up, so the deadline below
+            # only covers the task itself
+            self.pid = self.conn.recv()
+        self.conn.send((fn, args))
+        if not self.conn.poll(timeout):
+            raise TimeoutError
+        ok, value = self.conn.recv()
+        if not ok:
+            raise RuntimeError(value)
+        return value
+
+    def kill(self) -> None:
+        # SIGKILL, because user code can catch SIGTERM
+        self.process.kill()
+        self.process.join()
+        self.conn.close()
+
+
+class _WorkerPool:
+    """Fixed set of workers; a task waits here until a worker is idle."""
+
+    def __init__(self, size: int) -> None:
+        self._ctx = multiprocessing.get_context("spawn")
+        self._idle: asyncio.Queue = asyncio.Queue()
+        for _ in range(size):
+            self._idle.put_nowait(_Worker(self._ctx))
+
+    async def run(self, fn, args: tuple, timeout: float) -> Any:
+        worker = await self._idle.get()
+        try:
+            return await asyncio.to_thread(worker.call, fn, args, timeout)
+        except (TimeoutError, asyncio.CancelledError):
+            # Stuck, or mid-task for a caller that went away; replace just this worker
+            worker = self._replace(worker)
+            raise
+        except (EOFError, OSError) as e:
+            # Died mid-task (SIGXCPU, out of memory, os._exit, ...)
+            worker = self._replace(worker)
+            raise WorkerCrashed() from e
+        finally:
+            self._idle.put_nowait(worker)
+
+    def _replace(self, worker: _Worker) -> _Worker:
+        worker.kill()
+        return _Worker(self._ctx)
+
+    def close(self) -> None:
+        while not self._idle.empty():
+            self._idle.get_nowait().kill()
+
+
+# Worker pool for user code. exec()/eval() are CPU-bound and blocking, so they
+# must never run on the event loop thread.
+POOL: Optional[_WorkerPool] = None
+
+
+@app.on_event("startup")
+async def start_pool():
+    global POOL
+    POOL = _WorkerPool(os.cpu_count() or 1)
+
+
+@app.on_event("shutdown")
+async def stop_pool():
+    if POOL is not None:
+        POOL.close()
+
+
+@lru_cache(maxsize=1024)
+def _compile(code: str, mode: str):
+    """Compile user code once per worker; agent/eval loops resend the same snippets."""
+    return compile(code, "<user>", mode)
+
+
+def _fresh_context(context: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Build a new globals dict for one execution.
+
+    User code writes into its globals, so it must never be handed a dict that
+    outlives the request. A single dict is used for globals and locals so
+    functions defined by the code can still see its top-level names.
+    """
+    exec_context = {"__builtins__": builtins}
+    if context:
+        exec_context.update(context)
+    return exec_context
+
+
+# Recycled capture buffers, so each execution doesn't allocate two fresh StringIOs
+_BUFFER_POOL_SIZE = 32
+_buffer_pool: "queue.SimpleQueue[StringIO]" = queue.SimpleQueue()
+
+
+def _acquire_buffer() -> StringIO:
+    try:
+        return _buffer_pool.get_nowait()
+    except queue.Empty:
+        return StringIO()
+
+
+def _release_buffer(buf: StringIO) -> None:
+    buf.seek(0)
+    buf.truncate(0)
+    if _buffer_pool.qsize() < _BUFFER_POOL_SIZE:
+        _buffer_pool.put(buf)
+
+
+def _format_error(e: Exception, include_traceback: bool) -> str:
+    # Formatting a traceback walks every frame and reads source lines, so only
+    # pay for it when the caller asked
+    if not include_traceback:
+        return str(e)
+    return f"{str(e)}\n\n{traceback.format_exc()}"
+
+
+def _run_exec(code: str, context: Optional[Dict[str, Any]], timeout: Optional[int], include_traceback: bool) -> Tuple[bool, Optional[str], Optional[str], Any]:
+    """Execute code in a worker process. Returns (success, output, error, return_value)."""
+    _limit_cpu(timeout)
+
+    # Capture stdout and stderr
+    redirected_output = _acquire_buffer()
+    redirected_error = _acquire_buffer()
+
+    try:
+        # Prepare execution context
+        exec_context = _fresh_context(context)
+
+        # Execute the code
+        with redirect_stdout(redirected_output), redirect_stderr(redirected_error):
+            exec(_compile(code, "exec"), exec_context)
+
+        # Get the output
+        output = redirected_output.getvalue()
+        error_output = redirected_error.getvalue()
+
+        # Check if there's a return value
+        return_value = exec_context.get('__result__', None)
+
+        return True, output or None, error_output or None, return_value
+
+    except Exception as e:
+        return False, redirected_output.getvalue() or None, _format_error(e, include_traceback), None
+
+    finally:
+        _release_buffer(redirected_output)
+        _release_buffer(redirected_error)
+
+
+def _run_eval(code: str, context: Optional[Dict[str, Any]], timeout: Optional[int], include_traceback: bool) -> Tuple[bool, Optional[str], Any]:
+    """Evaluate an expression in a worker process. Returns (success, error, return_value)."""
+    _limit_cpu(timeout)
+    try:
+        # Prepare execution context
+        exec_context = _fresh_context(context)
+
+        # Evaluate the expression
+        return True, None, eval(_compile(code, "eval"), exec_context)
+
+    except Exception as e:
+        return False, _format_error(e, include_traceback), None
+
+
+async def _submit(fn, request: CodeExecutionRequest):
+    """Run fn in a worker, enforcing request.timeout."""
+    args = (request.code, request.context, request.timeout, request.include_traceback)
+    return await POOL.run(fn, args, request.timeout)
+
+
+@app.post("/execute", response_model=CodeExecutionResponse)
+async def execute_code(request: CodeExecutionRequest):
+    """
+    Execute Python code and return the output.
+
+    The code runs in a separate worker process so the event loop stays free
+    for other requests, and is killed if it exceeds request.timeout.
+
+    WARNING: This is a basic implementation. In production, you should:
+    - Add proper sandboxing
+    - Implement resource limits
+    - Add authentication/authorization
+    - Validate code before execution
+    """
+    try:
+        success, output, error, return_value = await _submit(_run_exec, request)
+    except TimeoutError:
+        return CodeExecutionResponse(
+            success=False,
+            error=f"Execution timed out after {request.timeout} seconds"
+        )
+    except WorkerCrashed:
+        return CodeExecutionResponse(
+            success=False,
+            error="Execution was interrupted because its worker process was terminated"
+        )
+    except Exception as e:
+        # e.g. a return value that cannot be pickled back from the worker
+        return CodeExecutionResponse(success=False, error=str(e))
+
+    return CodeExecutionResponse(
+        success=success,
+        output=output,
+        error=error,
+        return_value=return_value
+    )
+
+
+@app.post("/eval")
+async def evaluate_expression(request: CodeExecutionRequest):
+    """
+    Evaluate a Python expression and return the result.
+    """
+    try:
+        success, error, result = await _submit(_run_eval, request)
+    except TimeoutError:
+        return CodeExecutionResponse(
+            success=False,
+            error=f"Evaluation timed out after {request.timeout} seconds"
+        )
+    except WorkerCrashed:
+        return CodeExecutionResponse(
+            success=False,
+            error="Evaluation was interrupted because its worker process was terminated"
+        )
+    except Exception as e:
+        return CodeExecutionResponse(success=False, error=str(e))
+
+    return CodeExecutionResponse(
+        success=success,
+        error=error,
+        return_value=result
+    )
+
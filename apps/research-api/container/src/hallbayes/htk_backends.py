@@ -485,9 +485,12 @@ class OpenRouterBackend:
     ) -> None:
         try:
             import requests  # type: ignore
+            from requests.adapters import HTTPAdapter  # type: ignore
         except Exception as e:
             raise ImportError("Install `requests` to use OpenRouterBackend.") from e
-        self._req = requests
+        # Keep-alive session: reusing one backend reuses its TCP/TLS connections
+        self._req = requests.Session()
+        self._req.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=100))
         self.model = model
         self.api_key = api_key or os.environ.get("OPENROUTER_API_KEY", "")
         if not self.api_key:
@@ -1,35 +1,58 @@
 """
 research-antihal: FastAPI backend
 """
+import hashlib
+import logging
 import os
-import sys
-from pathlib import Path
-
-# Add the src directory to Python path to find hallbayes module
-sys.path.insert(0, str(Path(__file__).parent))
+import threading
+from functools import lru_cache, partial
+from typing import Optional
 
+from anyio import CapacityLimiter, to_thread
+from cachetools import TTLCache
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from hallbayes import OpenAIItem, OpenAIPlanner
 from hallbayes.htk_backends import OpenRouterBackend
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, SecretStr
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger("research-antihal")
 
 # Create FastAPI app
 app = FastAPI(
     title="Research Antihal API",
     description="Backend API for research-antihal",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
 )
 
 # Configure CORS
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # Configure this based on your frontend URL in production
+    allow_origins=os.getenv("CORS_ORIGINS", "http://localhost:3000").split(","),
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST"],
+    allow_headers=["content-type", "authorization"],
+    max_age=86400,  # Let browsers cache preflight responses for a day
 )
 
+# The code executor runs unauthenticated user code, so it is only served when
+# explicitly enabled. It shares this process's loop and threadpool.
+EXECUTOR_ENABLED = os.getenv("ENABLE_CODE_EXECUTOR", "").lower() in ("1", "true", "yes")
+
+if EXECUTOR_ENABLED:
+    try:
+        from src.executor import app as executor_app
+    except ImportError:  # started from inside src/, e.g. `python main.py`
+        from executor import app as executor_app
+
+    app.mount("/executor", executor_app)
+    # Mounted apps don't receive lifespan events, so run the executor's hooks with ours
+    app.router.on_startup.extend(executor_app.router.on_startup)
+    app.router.on_shutdown.extend(executor_app.router.on_shutdown)
+
 
 # Health check endpoint
 @app.get("/health")
@@ -40,62 +63,115 @@ async def health_check():
 
 # Example data model
 class ResearchQuery(BaseModel):
+    model_config = ConfigDict(extra="forbid", frozen=True, str_strip_whitespace=True)
+
     prompt: str
-    api_key: str  # API key passed in request body
+    api_key: SecretStr  # API key passed in request body; masked in reprs and logs
 
 
+# Estimation settings; the response cache key depends on all of them
+MODEL = "google/gemini-2.5-flash-lite"
+TEMPERATURE = 0.3
+N_SAMPLES = 3
+M = 4
 
-@app.post("/api/hallucinations/estimate")
-async def estimate_hallucinations(body: ResearchQuery):
-    # Get API key from request body
-    print(f"[Antihal] Received request with api_key present: {bool(body.api_key)}")
-    print(f"[Antihal] API key starts with: {body.api_key[:10] if body.api_key else 'None'}...")
+# Identical prompts recur in eval suites and retries; skip planner.run() for them.
+# Cached results are shared between callers, so they are only served to API keys
+# OpenRouter has already accepted (by completing an estimate); digests, not keys.
+_response_cache: TTLCache = TTLCache(maxsize=10_000, ttl=3600)
+_accepted_keys: TTLCache = TTLCache(maxsize=1024, ttl=3600)
+_response_cache_lock = threading.Lock()
 
-    api_key = body.api_key
-    if not api_key:
-        raise HTTPException(status_code=400, detail="api_key is required in request body")
-    
+
+def _cache_key(prompt: str) -> str:
+    raw = f"{MODEL}|{prompt}|{TEMPERATURE}|{N_SAMPLES}|{M}".encode()
+    return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+
+def _api_key_digest(api_key: str) -> str:
+    return hashlib.blake2b(api_key.encode(), digest_size=16).hexdigest()
+
+
+@lru_cache(maxsize=64)
+def _get_planner(api_key: str) -> OpenAIPlanner:
+    """One backend (and its HTTP connection pool) per API key, shared across requests."""
     backend = OpenRouterBackend(
-        model="google/gemini-2.5-flash-lite",
+        model=MODEL,
         http_referer="https://github.com/leochlon/hallbayes",
         x_title="HallBayes Test Script",
         api_key=api_key
     )
-    planner = OpenAIPlanner(backend, temperature=0.3)
+    return OpenAIPlanner(backend, temperature=TEMPERATURE)
+
+
+# Threads reserved for planner.run(); created at startup, inside the event loop
+PLANNER_THREADS = 64
+PLANNER_LIMIT: Optional[CapacityLimiter] = None
+
+
+@app.on_event("startup")
+async def configure_threadpools():
+    global PLANNER_LIMIT
+    PLANNER_LIMIT = CapacityLimiter(PLANNER_THREADS)
+    # Room for FastAPI's own sync offloading next to the planner threads
+    to_thread.current_default_thread_limiter().total_tokens = 200
+
+
+@app.on_event("startup")
+async def prewarm_planner():
+    """Build the planner for the container's own key so the first request doesn't pay for it."""
+    api_key = os.getenv("OPENROUTER_API_KEY")
+    if api_key:
+        _get_planner(api_key)
+
+
+@app.post("/api/hallucinations/estimate")
+async def estimate_hallucinations(body: ResearchQuery, no_cache: bool = False):
+    # Get API key from request body
+    api_key = body.api_key.get_secret_value()
+    if not api_key:
+        raise HTTPException(status_code=400, detail="api_key is required in request body")
+
+    key = _cache_key(body.prompt)
+    key_digest = _api_key_digest(api_key)
+    if not no_cache:
+        with _response_cache_lock:
+            cached = _response_cache.get(key) if key_digest in _accepted_keys else None
+        if cached is not None:
+            return cached
 
     item = OpenAIItem(
         prompt=body.prompt,
-        n_samples=3,
-        m=4,
+        n_samples=N_SAMPLES,
+        m=M,
         skeleton_policy="closed_book"
     )
 
-    metrics = planner.run(
-        [item], 
+    # planner.run() does blocking HTTP calls; keep it off the event loop,
+    # on its own limiter so long LLM calls can't exhaust the shared threadpool
+    run = partial(
+        _get_planner(api_key).run,
+        [item],
         h_star=0.05,           # Target 5% hallucination max
         isr_threshold=1.0,     # Standard ISR gate
         margin_extra_bits=0.2, # Safety margin
         B_clip=12.0,          # Clipping bound
         clip_mode="one-sided" # Conservative mode
     )
+    metrics = await to_thread.run_sync(run, limiter=PLANNER_LIMIT)
+    m = metrics[0]
 
-    for m in metrics:
-        print("\n" + "="*60)
-        print(f"Decision: {'✅ ANSWER' if m.decision_answer else '⛔ REFUSE'}")
-        print(f"Hallucination Risk: {m.roh_bound*100:.2f}% (max bound)")
-        print(f"ISR (Info Sufficiency Ratio): {m.isr:.3f}")
-        print(f"Information Budget (Δ̄): {m.delta_bar:.2f} nats")
-        print(f"Bits to Trust (B2T): {m.b2t:.3f} nats")
-        print(f"Prior Probability (avg): {m.q_avg:.3f}")
-        print(f"Prior Probability (conservative): {m.q_conservative:.3f}")
-        if m.rationale:
-            print(f"\nRationale: {m.rationale}")
-        print("="*60)
-    return {
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("decision=%s roh=%.4f isr=%.3f", m.decision_answer, m.roh_bound, m.isr)
+    result = {
         "hallucination_risk": m.roh_bound,
         "isr": m.isr,
         "info_budget": m.delta_bar
     }
+    with _response_cache_lock:
+        _response_cache[key] = result
+        _accepted_keys[key_digest] = True
+    return result
 
 
 # Example GET endpoint
@@ -108,8 +184,8 @@ async def get_status():
         "endpoints": [
             "/health",
             "/api/hallucinations/estimate",
-            "/api/status"
-        ]
+            "/api/status",
+        ] + (["/executor/execute", "/executor/eval"] if EXECUTOR_ENABLED else [])
     }
 
 
@@ -119,9 +195,21 @@ if __name__ == "__main__":
     # Get port from environment variable or default to 8000
     port = int(os.getenv("PORT", "8000"))
     
-    uvicorn.run(
-        "main:app",
-        host="0.0.0.0",
-        port=port,
-        reload=True,  # Enable auto-reload in development
-    )
+    if os.getenv("ENV", "dev") == "dev":
+        uvicorn.run(
+            "main:app",
+            host="0.0.0.0",
+            port=port,
+            reload=True,  # Enable auto-reload in development
+        )
+    else:
+        uvicorn.run(
+            "main:app",
+            host="0.0.0.0",
+            port=port,
+            workers=os.cpu_count(),
+            loop="auto",  # uvloop where installed (not on Windows)
+            http="httptools",
+            reload=False,
+            access_log=False,
+        )
@@ -6,6 +6,7 @@ Simple test script for hallbayes with OpenRouter backend
 
 import os
 from pathlib import Path
+from dotenv import dotenv_values
 from hallbayes import OpenAIPlanner, OpenAIItem, generate_answer_if_allowed
 from hallbayes.htk_backends import OpenRouterBackend
 from hallbayes import OpenAIBackend, OpenAIItem, OpenAIPlanner
@@ -14,13 +15,8 @@ def load_env():
     """Load .env file if it exists"""
     env_path = Path(__file__).parent / ".env"
     if env_path.exists():
-        with open(env_path) as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    key, value = line.split('=', 1)
-                    if value:  # Only set if value is not empty
-                        os.environ[key.strip()] = value.strip()
+        # Only set variables that have a non-empty value
+        os.environ.update({k: v for k, v in dotenv_values(env_path).items() if v})
 
 def main():
     # Load .env file
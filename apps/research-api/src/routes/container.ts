@@ -51,7 +51,7 @@ export const containerRoutes = new Hono<AppType>()
 
 			// Execute Python code
 			const response = await container.fetch(
-				new Request('http://container/execute', {
+				new Request('http://container/executor/execute', {
 					method: 'POST',
 					headers: { 'Content-Type': 'application/json' },
 					body: JSON.stringify({ code }),